@@ -0,0 +1,45 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Lazily resolved ZenML exception classes shared by all ZenML wrappers.
+
+Like `LazyImportWrapper`, the module maps each name in `_LAZY` to a
+`(module_name, symbol_name)` pair and imports it on attribute access, so
+importing this module does not import ZenML. Wrappers only name these classes
+in `except` clauses, which are evaluated while matching a raised exception, so
+the result is not cached.
+"""
+
+from typing import Dict, Tuple
+
+from lazy_import import lazy_import
+
+_LAZY: Dict[str, Tuple[str, str]] = {
+    name: ("zenml.exceptions", name)
+    for name in (
+        "ZenMLBaseException",
+        "ValidationError",
+        "AuthorizationException",
+        "IllegalOperationError",
+        "StackComponentValidationError",
+        "ZenKeyError",
+    )
+}
+
+
+def __getattr__(name):
+    """Resolves a ZenML exception class declared in `_LAZY`."""
+    try:
+        module_name, symbol_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+    return lazy_import(module_name, symbol_name)
@@ -13,13 +13,184 @@
 """This module provides wrappers for ZenML configuration and operations."""
 
 import json
-import pathlib
-from typing import Any
+import os
+from functools import wraps
+from operator import attrgetter
+from typing import Any, Dict, Optional, Tuple
+
+import zenml_exceptions
+
+_RUN_FIELDS = attrgetter(
+    "id",
+    "body.pipeline.name",
+    "body.status",
+    "body.pipeline.body.version",
+    "body.stack.name",
+    "metadata.start_time",
+    "metadata.end_time",
+    "metadata.client_environment",
+)
+
+
+def _iso(dt) -> Optional[str]:
+    """Returns the ISO 8601 representation of an optional datetime."""
+    return dt.isoformat() if dt else None
+
+
+def _serialize_run(run) -> dict:
+    """Serializes a hydrated pipeline run for the extension.
+
+    Args:
+        run: ZenML pipeline run response.
+    Returns:
+        dict: Dictionary containing the pipeline run data.
+    """
+    (
+        run_id,
+        name,
+        status,
+        version,
+        stack_name,
+        start_time,
+        end_time,
+        env,
+    ) = _RUN_FIELDS(run)
+    env_get = env.get
+    return {
+        "id": str(run_id),
+        "name": name,
+        "status": status,
+        "version": version,
+        "stackName": stack_name,
+        "startTime": _iso(start_time),
+        "endTime": _iso(end_time),
+        "os": env_get("os", "Unknown OS"),
+        "osVersion": env_get("os_version") or env_get("mac_version", "Unknown Version"),
+        "pythonVersion": env_get("python_version", "Unknown"),
+    }
+
+
+def _serialize_component(component) -> dict:
+    """Serializes a stack component for the extension.
+
+    Args:
+        component: ZenML stack component response.
+    Returns:
+        dict: Dictionary containing the component data.
+    """
+    return {
+        "id": str(component.id),
+        "name": component.name,
+        "flavor": component.flavor,
+        "type": component.type,
+    }
+
+
+def _error_response(message: str, error: Exception) -> dict:
+    """Builds the error response returned to the extension.
+
+    Args:
+        message (str): Description of the failed operation.
+        error (Exception): The exception that caused the failure.
+    Returns:
+        dict: Dictionary containing the error message.
+    """
+    return {"error": f"{message}: {error}"}
+
+
+def zenml_error_handler(message: str):
+    """Decorator turning ZenML errors raised by a wrapper method into responses.
+
+    Args:
+        message (str): Description of the operation, used as the error prefix.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except zenml_exceptions.ZenMLBaseException as e:
+                return _error_response(message, e)
+
+        return wrapper
+
+    return decorator
+
+
+def _paginated_response(
+    key: str, items: list, page_obj: Any, page: int, max_size: int
+) -> dict:
+    """Builds the paginated response returned by the list endpoints.
+
+    Args:
+        key (str): Name under which the serialized items are returned.
+        items (list): Serialized items of the page.
+        page_obj (Any): ZenML page the items were taken from.
+        page (int): Requested page number.
+        max_size (int): Requested page size.
+    Returns:
+        dict: Dictionary containing the items and pagination details.
+    """
+    return {
+        key: items,
+        "total": page_obj.total,
+        "total_pages": page_obj.total_pages,
+        "current_page": page,
+        "items_per_page": max_size,
+    }
+
+
+def _unpack_args(args, *defaults) -> tuple:
+    """Pads positional command arguments with defaults for the missing ones.
+
+    Args:
+        args (list): Positional arguments received from the LSP client.
+        *defaults: One default value per expected argument.
+    Returns:
+        tuple: Exactly `len(defaults)` argument values.
+    """
+    return (*args, *defaults[len(args) :])[: len(defaults)]
+
+
+class LazyImportWrapper:
+    """Base class for wrappers that expose lazily imported ZenML symbols.
+
+    Subclasses declare the symbols they need in `_LAZY`, mapping an attribute
+    name to a `(module_name, symbol_name)` pair. The symbol is imported on first
+    access and stored on the instance, so later accesses are plain attribute reads.
+    """
+
+    _LAZY: Dict[str, Tuple[str, str]] = {}
+
+    def __getattr__(self, name):
+        """Resolves and caches a lazily imported symbol declared in `_LAZY`."""
+        try:
+            module_name, symbol_name = self._LAZY[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+        value = self.lazy_import(module_name, symbol_name)
+        object.__setattr__(self, name, value)
+        return value
 
 
-class GlobalConfigWrapper:
+class GlobalConfigWrapper(LazyImportWrapper):
     """Wrapper class for global configuration management."""
 
+    _LAZY = {
+        "fileio": ("zenml.io", "fileio"),
+        "get_global_config_directory": (
+            "zenml.utils.io_utils",
+            "get_global_config_directory",
+        ),
+        "RestZenStoreConfiguration": (
+            "zenml.zen_stores.rest_zen_store",
+            "RestZenStoreConfiguration",
+        ),
+    }
+
     def __init__(self):
         # pylint: disable=wrong-import-position,import-error
         from lazy_import import lazy_import
@@ -27,6 +198,18 @@ class GlobalConfigWrapper:
         self.lazy_import = lazy_import
         """Initializes the GlobalConfigWrapper instance."""
         self._gc = lazy_import("zenml.config.global_config", "GlobalConfiguration")()
+        # Attribute and setter names changed across ZenML versions; the installed
+        # version is fixed for the process, so resolve them once here. Probe the
+        # class so the store_configuration property itself is not run at startup.
+        self._store_attr = (
+            "store_configuration"
+            if hasattr(type(self._gc), "store_configuration")
+            else "store"
+        )
+        self._set_store_fn = getattr(self._gc, "set_store_configuration", None)
+        if self._set_store_fn is None:
+            self._set_store_fn = getattr(self._gc, "set_store", None)
+        self._config_paths: Optional[Tuple[str, str]] = None
 
     @property
     def gc(self):
@@ -34,22 +217,24 @@ class GlobalConfigWrapper:
         return self._gc
 
     @property
-    def fileio(self):
-        """Provides access to file I/O operations."""
-        return self.lazy_import("zenml.io", "fileio")
+    def store_configuration(self):
+        """Returns the active store configuration of the global configuration."""
+        return getattr(self._gc, self._store_attr)
 
-    @property
-    def get_global_config_directory(self):
-        """Returns the function to get the global configuration directory."""
-        return self.lazy_import("zenml.utils.io_utils", "get_global_config_directory")
+    def _get_config_paths(self) -> Tuple[str, str]:
+        """Resolves the global configuration directory and file paths once.
 
-    @property
-    def RestZenStoreConfiguration(self):
-        """Returns the RestZenStoreConfiguration class for store configuration."""
-        # pylint: disable=not-callable
-        return self.lazy_import(
-            "zenml.zen_stores.rest_zen_store", "RestZenStoreConfiguration"
-        )
+        The global configuration directory does not change for the lifetime of
+        the process, so only the existence checks are repeated by callers.
+
+        Returns:
+            Tuple[str, str]: Configuration directory path and config file path.
+        """
+        if self._config_paths is None:
+            # pylint: disable=not-callable
+            config_dir = os.path.normpath(self.get_global_config_directory())
+            self._config_paths = (config_dir, os.path.join(config_dir, "config.yaml"))
+        return self._config_paths
 
     def get_global_config_directory_path(self) -> str:
         """Get the global configuration directory path.
@@ -57,10 +242,9 @@ class GlobalConfigWrapper:
         Returns:
             str: Path to the global configuration directory.
         """
-        # pylint: disable=not-callable
-        config_dir = pathlib.Path(self.get_global_config_directory())
-        if self.fileio.exists(str(config_dir)):
-            return str(config_dir)
+        config_dir, _ = self._get_config_paths()
+        if self.fileio.exists(config_dir):
+            return config_dir
         return "Configuration directory does not exist."
 
     def get_global_config_file_path(self) -> str:
@@ -69,11 +253,9 @@ class GlobalConfigWrapper:
         Returns:
             str: Path to the global configuration file.
         """
-        # pylint: disable=not-callable
-        config_dir = pathlib.Path(self.get_global_config_directory())
-        config_path = config_dir / "config.yaml"
-        if self.fileio.exists(str(config_path)):
-            return str(config_path)
+        _, config_path = self._get_config_paths()
+        if self.fileio.exists(config_path):
+            return config_path
         return "Configuration file does not exist."
 
     def set_store_configuration(self, remote_url: str, access_token: str):
@@ -89,15 +271,11 @@ class GlobalConfigWrapper:
         )
 
         # Method name changed in 0.55.4 - 0.56.1
-        if hasattr(self.gc, "set_store_configuration"):
-            self.gc.set_store_configuration(new_store_config)
-        elif hasattr(self.gc, "set_store"):
-            self.gc.set_store(new_store_config)
-        else:
+        if self._set_store_fn is None:
             raise AttributeError(
                 "GlobalConfiguration object does not have a method to set store configuration."
             )
-        self.gc.set_store(new_store_config)
+        self._set_store_fn(new_store_config)
 
     def get_global_configuration(self) -> dict:
         """Get the global configuration.
@@ -105,7 +283,7 @@ class GlobalConfigWrapper:
         Returns:
             dict: Global configuration.
         """
-        gc_dict = json.loads(self.gc.json(indent=2))
+        gc_dict = json.loads(self.gc.json())
         user_id = gc_dict.get("user_id", "")
 
         if user_id and user_id.startswith("UUID('") and user_id.endswith("')"):
@@ -114,9 +292,21 @@ class GlobalConfigWrapper:
         return gc_dict
 
 
-class ZenServerWrapper:
+class ZenServerWrapper(LazyImportWrapper):
     """Wrapper class for Zen Server management."""
 
+    _LAZY = {
+        "web_login": ("zenml.cli", "web_login"),
+        "ServerDeploymentNotFoundError": (
+            "zenml.zen_server.deploy.exceptions",
+            "ServerDeploymentNotFoundError",
+        ),
+        "StoreType": ("zenml.enums", "StoreType"),
+        "BaseZenStore": ("zenml.zen_stores.base_zen_store", "BaseZenStore"),
+        "ServerDeployer": ("zenml.zen_server.deploy.deployer", "ServerDeployer"),
+        "get_active_deployment": ("zenml.zen_server.utils", "get_active_deployment"),
+    }
+
     def __init__(self, config_wrapper):
         """Initializes ZenServerWrapper with a configuration wrapper."""
         # pylint: disable=wrong-import-position,import-error
@@ -130,57 +320,14 @@ class ZenServerWrapper:
         """Returns the global configuration via the config wrapper."""
         return self._config_wrapper.gc
 
-    @property
-    def web_login(self):
-        """Provides access to the ZenML web login function."""
-        return self.lazy_import("zenml.cli", "web_login")
-
-    @property
-    def ServerDeploymentNotFoundError(self):
-        """Returns the ZenML ServerDeploymentNotFoundError class."""
-        return self.lazy_import(
-            "zenml.zen_server.deploy.exceptions", "ServerDeploymentNotFoundError"
-        )
-
-    @property
-    def AuthorizationException(self):
-        """Returns the ZenML AuthorizationException class."""
-        return self.lazy_import("zenml.exceptions", "AuthorizationException")
-
-    @property
-    def StoreType(self):
-        """Returns the ZenML StoreType enum."""
-        return self.lazy_import("zenml.enums", "StoreType")
-
-    @property
-    def BaseZenStore(self):
-        """Returns the BaseZenStore class for ZenML store operations."""
-        return self.lazy_import("zenml.zen_stores.base_zen_store", "BaseZenStore")
-
-    @property
-    def ServerDeployer(self):
-        """Provides access to the ZenML server deployment utilities."""
-        return self.lazy_import("zenml.zen_server.deploy.deployer", "ServerDeployer")
-
-    @property
-    def get_active_deployment(self):
-        """Returns the function to get the active ZenML server deployment."""
-        return self.lazy_import("zenml.zen_server.utils", "get_active_deployment")
-
     def get_server_info(self) -> dict:
         """Fetches the ZenML server info.
 
         Returns:
             dict: Dictionary containing server info.
         """
-        store_info = json.loads(self.gc.zen_store.get_store_info().json(indent=2))
-        # Handle both 'store' and 'store_configuration' depending on version
-        store_attr_name = (
-            "store_configuration"
-            if hasattr(self.gc, "store_configuration")
-            else "store"
-        )
-        store_config = json.loads(getattr(self.gc, store_attr_name).json(indent=2))
+        store_info = json.loads(self.gc.zen_store.get_store_info().json())
+        store_config = json.loads(self._config_wrapper.store_configuration.json())
         return {"storeInfo": store_info, "storeConfig": store_config}
 
     def connect(self, args, **kwargs) -> dict:
@@ -191,8 +338,7 @@ class ZenServerWrapper:
         Returns:
             dict: Dictionary containing the result of the operation.
         """
-        url = args[0]
-        verify_ssl = args[1] if len(args) > 1 else True
+        url, verify_ssl = _unpack_args(args, None, True)
 
         if not url:
             return {"error": "Server URL is required."}
@@ -204,8 +350,8 @@ class ZenServerWrapper:
                 remote_url=url, access_token=access_token
             )
             return {"message": "Connected successfully.", "access_token": access_token}
-        except self.AuthorizationException as e:
-            return {"error": f"Authorization failed: {str(e)}"}
+        except zenml_exceptions.AuthorizationException as e:
+            return _error_response("Authorization failed", e)
 
     def disconnect(self, args) -> dict:
         """Disconnects from a ZenML server.
@@ -216,13 +362,7 @@ class ZenServerWrapper:
             dict: Dictionary containing the result of the operation.
         """
         try:
-            # Adjust for changes from 'store' to 'store_configuration'
-            store_attr_name = (
-                "store_configuration"
-                if hasattr(self.gc, "store_configuration")
-                else "store"
-            )
-            url = getattr(self.gc, store_attr_name).url
+            url = self._config_wrapper.store_configuration.url
             store_type = self.BaseZenStore.get_store_type(url)
 
             # pylint: disable=not-callable
@@ -245,7 +385,7 @@ class ZenServerWrapper:
 
             return {"message": " ".join(messages)}
         except self.ServerDeploymentNotFoundError as e:
-            return {"error": f"Failed to disconnect: {str(e)}"}
+            return _error_response("Failed to disconnect", e)
 
 
 class PipelineRunsWrapper:
@@ -253,77 +393,32 @@ class PipelineRunsWrapper:
 
     def __init__(self, client):
         """Initializes PipelineRunsWrapper with a ZenML client."""
-        # pylint: disable=wrong-import-position,import-error
-        from lazy_import import lazy_import
-
-        self.lazy_import = lazy_import
         self.client = client
 
-    @property
-    def ValidationError(self):
-        """Returns the ZenML ZenMLBaseException class."""
-        return self.lazy_import("zenml.exceptions", "ValidationError")
-
-    @property
-    def ZenMLBaseException(self):
-        """Returns the ZenML ZenMLBaseException class."""
-        return self.lazy_import("zenml.exceptions", "ZenMLBaseException")
-
     def fetch_pipeline_runs(self, args):
         """Fetches all ZenML pipeline runs.
 
         Returns:
             list: List of dictionaries containing pipeline run data.
         """
-        page = args[0]
-        max_size = args[1]
+        try:
+            page, max_size, *_ = args
+        except ValueError:
+            return {"error": "Insufficient arguments provided."}
+
         try:
             runs_page = self.client.list_pipeline_runs(
                 sort_by="desc:updated", page=page, size=max_size, hydrate=True
             )
-            runs_data = [
-                {
-                    "id": str(run.id),
-                    "name": run.body.pipeline.name,
-                    "status": run.body.status,
-                    "version": run.body.pipeline.body.version,
-                    "stackName": run.body.stack.name,
-                    "startTime": (
-                        run.metadata.start_time.isoformat()
-                        if run.metadata.start_time
-                        else None
-                    ),
-                    "endTime": (
-                        run.metadata.end_time.isoformat()
-                        if run.metadata.end_time
-                        else None
-                    ),
-                    "os": run.metadata.client_environment.get("os", "Unknown OS"),
-                    "osVersion": run.metadata.client_environment.get(
-                        "os_version",
-                        run.metadata.client_environment.get(
-                            "mac_version", "Unknown Version"
-                        ),
-                    ),
-                    "pythonVersion": run.metadata.client_environment.get(
-                        "python_version", "Unknown"
-                    ),
-                }
-                for run in runs_page.items
-            ]
+            runs_data = [_serialize_run(run) for run in runs_page.items]
 
-            return {
-                "runs": runs_data,
-                "total": runs_page.total,
-                "total_pages": runs_page.total_pages,
-                "current_page": page,
-                "items_per_page": max_size,
-            }
-        except self.ValidationError as e:
+            return _paginated_response("runs", runs_data, runs_page, page, max_size)
+        except zenml_exceptions.ValidationError as e:
             return {"error": "ValidationError", "message": str(e)}
-        except self.ZenMLBaseException as e:
-            return [{"error": f"Failed to retrieve pipeline runs: {str(e)}"}]
+        except zenml_exceptions.ZenMLBaseException as e:
+            return [_error_response("Failed to retrieve pipeline runs", e)]
 
+    @zenml_error_handler("Failed to delete pipeline run")
     def delete_pipeline_run(self, args) -> dict:
         """Deletes a ZenML pipeline run.
 
@@ -332,12 +427,12 @@ class PipelineRunsWrapper:
         Returns:
             dict: Dictionary containing the result of the operation.
         """
-        try:
-            run_id = args[0]
-            self.client.delete_pipeline_run(run_id)
-            return {"message": f"Pipeline run `{run_id}` deleted successfully."}
-        except self.ZenMLBaseException as e:
-            return {"error": f"Failed to delete pipeline run: {str(e)}"}
+        (run_id,) = _unpack_args(args, None)
+        if not run_id:
+            return {"error": "Missing run_id"}
+
+        self.client.delete_pipeline_run(run_id)
+        return {"message": f"Pipeline run `{run_id}` deleted successfully."}
 
 
 class StacksWrapper:
@@ -345,58 +440,28 @@ class StacksWrapper:
 
     def __init__(self, client):
         """Initializes StacksWrapper with a ZenML client."""
-        # pylint: disable=wrong-import-position,import-error
-        from lazy_import import lazy_import
-
-        self.lazy_import = lazy_import
         self.client = client
 
-    @property
-    def ZenMLBaseException(self):
-        """Returns the ZenML ZenMLBaseException class."""
-        return self.lazy_import("zenml.exceptions", "ZenMLBaseException")
-
-    @property
-    def ValidationError(self):
-        """Returns the ZenML ZenMLBaseException class."""
-        return self.lazy_import("zenml.exceptions", "ValidationError")
-
-    @property
-    def IllegalOperationError(self) -> Any:
-        """Returns the IllegalOperationError class."""
-        return self.lazy_import("zenml.exceptions", "IllegalOperationError")
-
-    @property
-    def StackComponentValidationError(self):
-        """Returns the ZenML StackComponentValidationError class."""
-        return self.lazy_import("zenml.exceptions", "StackComponentValidationError")
-
-    @property
-    def ZenKeyError(self) -> Any:
-        """Returns the ZenKeyError class."""
-        return self.lazy_import("zenml.exceptions", "ZenKeyError")
-
     def fetch_stacks(self, args):
         """Fetches all ZenML stacks and components with pagination."""
-        page = args[0]
-        max_size = args[1]
+        try:
+            page, max_size, *_ = args
+        except ValueError:
+            return {"error": "Insufficient arguments provided."}
+
         try:
             stacks_page = self.client.list_stacks(
                 page=page, size=max_size, hydrate=True
             )
             stacks_data = self.process_stacks(stacks_page.items)
 
-            return {
-                "stacks": stacks_data,
-                "total": stacks_page.total,
-                "total_pages": stacks_page.total_pages,
-                "current_page": page,
-                "items_per_page": max_size,
-            }
-        except self.ValidationError as e:
+            return _paginated_response(
+                "stacks", stacks_data, stacks_page, page, max_size
+            )
+        except zenml_exceptions.ValidationError as e:
             return {"error": "ValidationError", "message": str(e)}
-        except self.ZenMLBaseException as e:
-            return [{"error": f"Failed to retrieve stacks: {str(e)}"}]
+        except zenml_exceptions.ZenMLBaseException as e:
+            return [_error_response("Failed to retrieve stacks", e)]
 
     def process_stacks(self, stacks):
         """Process stacks to the desired format."""
@@ -405,35 +470,25 @@ class StacksWrapper:
                 "id": str(stack.id),
                 "name": stack.name,
                 "components": {
-                    component_type: [
-                        {
-                            "id": str(component.id),
-                            "name": component.name,
-                            "flavor": component.flavor,
-                            "type": component.type,
-                        }
-                        for component in components
-                    ]
+                    component_type: [_serialize_component(c) for c in components]
                     for component_type, components in stack.components.items()
                 },
             }
             for stack in stacks
         ]
 
+    @zenml_error_handler("Failed to retrieve active stack")
     def get_active_stack(self) -> dict:
         """Fetches the active ZenML stack.
 
         Returns:
             dict: Dictionary containing active stack data.
         """
-        try:
-            active_stack = self.client.active_stack_model
-            return {
-                "id": str(active_stack.id),
-                "name": active_stack.name,
-            }
-        except self.ZenMLBaseException as e:
-            return {"error": f"Failed to retrieve active stack: {str(e)}"}
+        active_stack = self.client.active_stack_model
+        return {
+            "id": str(active_stack.id),
+            "name": active_stack.name,
+        }
 
     def set_active_stack(self, args) -> dict:
         """Sets the active ZenML stack.
@@ -443,7 +498,7 @@ class StacksWrapper:
         Returns:
             dict: Dictionary containing the active stack data.
         """
-        stack_name_or_id = args[0]
+        (stack_name_or_id,) = _unpack_args(args, None)
 
         if not stack_name_or_id:
             return {"error": "Missing stack_name_or_id"}
@@ -467,8 +522,7 @@ class StacksWrapper:
         Returns:
             dict: Dictionary containing the renamed stack data.
         """
-        stack_name_or_id = args[0]
-        new_stack_name = args[1]
+        stack_name_or_id, new_stack_name = _unpack_args(args, None, None)
 
         if not stack_name_or_id or not new_stack_name:
             return {"error": "Missing stack_name_or_id or new_stack_name"}
@@ -481,7 +535,7 @@ class StacksWrapper:
             return {
                 "message": f"Stack `{stack_name_or_id}` successfully renamed to `{new_stack_name}`!"
             }
-        except (KeyError, self.IllegalOperationError) as err:
+        except (KeyError, zenml_exceptions.IllegalOperationError) as err:
             return {"error": str(err)}
 
     def copy_stack(self, args) -> dict:
@@ -492,8 +546,7 @@ class StacksWrapper:
         Returns:
             dict: Dictionary containing the copied stack data.
         """
-        source_stack_name_or_id = args[0]
-        target_stack_name = args[1]
+        source_stack_name_or_id, target_stack_name = _unpack_args(args, None, None)
 
         if not source_stack_name_or_id or not target_stack_name:
             return {
@@ -505,7 +558,7 @@ class StacksWrapper:
                 name_id_or_prefix=source_stack_name_or_id
             )
             component_mapping = {
-                c_type: [c.id for c in components][0]
+                c_type: next(iter(components)).id
                 for c_type, components in stack_to_copy.components.items()
                 if components
             }
@@ -520,7 +573,7 @@ class StacksWrapper:
                 )
             }
         except (
-            self.ZenKeyError,
-            self.StackComponentValidationError,
+            zenml_exceptions.ZenKeyError,
+            zenml_exceptions.StackComponentValidationError,
         ) as e:
             return {"error": str(e)}
@@ -5,7 +5,9 @@
 import json
 import os
 import pathlib
+import re
 import urllib.request as url_lib
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import nox  # pylint: disable=import-error
@@ -25,12 +27,14 @@ def _install_bundle(session: nox.Session) -> None:
     )
 
 
+_TODO_PATTERN = re.compile(rb"^# TODO:", re.MULTILINE)
+
+
 def _check_files(names: List[str]) -> None:
     root_dir = pathlib.Path(__file__).parent
     for name in names:
         file_path = root_dir / name
-        lines: List[str] = file_path.read_text().splitlines()
-        if any(line for line in lines if line.startswith("# TODO:")):
+        if _TODO_PATTERN.search(file_path.read_bytes()):
             # pylint: disable=broad-exception-raised
             raise Exception(f"Please update {os.fspath(file_path)}.")
 
@@ -67,17 +71,22 @@ def _update_npm_packages(session: nox.Session) -> None:
     package_json_path = pathlib.Path(__file__).parent / "package.json"
     package_json = json.loads(package_json_path.read_text(encoding="utf-8"))
 
-    for package in package_json["dependencies"]:
-        if package not in pinned:
-            data = _get_package_data(package)
-            latest = "^" + data["dist-tags"]["latest"]
-            package_json["dependencies"][package] = latest
+    sections = ("dependencies", "devDependencies")
+    packages = {
+        package
+        for section in sections
+        for package in package_json[section]
+        if package not in pinned
+    }
+    # Registry lookups are independent network round trips; run them concurrently.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        package_data = dict(zip(packages, executor.map(_get_package_data, packages)))
 
-    for package in package_json["devDependencies"]:
-        if package not in pinned:
-            data = _get_package_data(package)
-            latest = "^" + data["dist-tags"]["latest"]
-            package_json["devDependencies"][package] = latest
+    for section in sections:
+        for package in package_json[section]:
+            if package in package_data:
+                latest = "^" + package_data[package]["dist-tags"]["latest"]
+                package_json[section][package] = latest
 
     # Ensure engine matches the package
     if (
@@ -148,15 +157,15 @@ def lint(session: nox.Session) -> None:
 
     # check formatting using black
     session.install("black")
-    session.run("black", "--check", "./bundled/tool")
-    session.run("black", "--check", "./src/test/python_tests")
-    session.run("black", "--check", "noxfile.py")
+    session.run(
+        "black", "--check", "./bundled/tool", "./src/test/python_tests", "noxfile.py"
+    )
 
     # check import sorting using isort
     session.install("isort")
-    session.run("isort", "--check", "./bundled/tool")
-    session.run("isort", "--check", "./src/test/python_tests")
-    session.run("isort", "--check", "noxfile.py")
+    session.run(
+        "isort", "--check", "./bundled/tool", "./src/test/python_tests", "noxfile.py"
+    )
 
     # check typescript code
     session.run("npm", "run", "lint", external=True)
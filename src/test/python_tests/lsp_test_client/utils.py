@@ -14,11 +14,14 @@
 """
 Utility functions for use with tests.
 """
+
+import functools
 import json
 import os
 import pathlib
 import platform
-from random import choice
+import string
+from random import choices
 
 from .constants import PROJECT_ROOT
 
@@ -40,9 +43,7 @@ class PythonFile:
 
     def __init__(self, contents, root):
         self.contents = contents
-        self.basename = "".join(
-            choice("abcdefghijklmnopqrstuvwxyz") if i < 8 else ".py" for i in range(9)
-        )
+        self.basename = "".join(choices(string.ascii_lowercase, k=8)) + ".py"
         self.fullpath = os.path.join(root, self.basename)
 
     def __enter__(self):
@@ -56,17 +57,20 @@ class PythonFile:
         os.unlink(self.fullpath)
 
 
+@functools.lru_cache(maxsize=1)
+def _package_json():
+    """Reads and parses package.json once per test session."""
+    return json.loads((PROJECT_ROOT / "package.json").read_text())
+
+
 def get_server_info_defaults():
     """Returns server info from package.json"""
-    package_json_path = PROJECT_ROOT / "package.json"
-    package_json = json.loads(package_json_path.read_text())
-    return package_json["serverInfo"]
+    return _package_json()["serverInfo"]
 
 
 def get_initialization_options():
     """Returns initialization options from package.json"""
-    package_json_path = PROJECT_ROOT / "package.json"
-    package_json = json.loads(package_json_path.read_text())
+    package_json = _package_json()
 
     server_info = package_json["serverInfo"]
     server_id = server_info["module"]